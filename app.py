@@ -3,14 +3,17 @@
 # ============================
 
 import os  # Interact with the operating system and handle environment variables
+import hmac  # Constant-time string comparison for credentials
+import tempfile  # Locate a writable directory for the template bytecode cache
 from functools import wraps  # Create decorator functions
-from datetime import datetime  # Work with dates and times
+from datetime import date  # Work with dates
 from urllib.parse import urlparse, urljoin  # Parse and manipulate URLs
 
 # ============================
 # 2. Third-Party Library Imports
 # ============================
 
+import orjson  # C-accelerated JSON encoder/decoder
 from flask import (
     Flask,            # The core Flask class to create the application
     render_template,  # Render HTML templates
@@ -19,14 +22,31 @@ from flask import (
     url_for,          # Build URLs for specific functions
     jsonify,          # Return JSON responses
     session,          # Manage user sessions
-    flash             # Display flashed messages to users
+    flash,            # Display flashed messages to users
+    g,                # Per-request application context storage
+    abort             # Abort request handling with an HTTP error
 )
-from flask_sqlalchemy import SQLAlchemy  # ORM for database interactions
+from flask.json.provider import JSONProvider  # Base class for custom JSON handling
 from flask_migrate import Migrate          # Handle database migrations
+from flask_caching import Cache            # Cache rendered pages between writes
 from dotenv import load_dotenv            # Load environment variables from a .env file
+from werkzeug.security import generate_password_hash, check_password_hash  # Hash and verify credentials
+from jinja2 import FileSystemBytecodeCache  # Persist compiled templates across restarts
+from sqlalchemy import (
+    update, delete, insert, select,        # Build SQL statements directly
+    func, literal, case, bindparam, event  # SQL functions, literals, bind params and engine events
+)
+from sqlalchemy.exc import IntegrityError  # Detect foreign-key rejections
+from sqlalchemy.pool import QueuePool      # Reuse warm SQLite connections across requests
+
+# ============================
+# 3. Local Application Imports
+# ============================
+
+from models import db, Quest, Objective   # Shared SQLAlchemy instance and models
 
 # ============================
-# 3. Application Setup
+# 4. Application Setup
 # ============================
 
 # Load environment variables from .env file
@@ -36,8 +56,22 @@ from dotenv import load_dotenv            # Load environment variables from a .e
 # Initialize the Flask application
 app = Flask(__name__)
 
+class ORJSONProvider(JSONProvider):
+    """
+    JSON provider backed by orjson, so jsonify and request JSON parsing run
+    through a C encoder instead of the stdlib json module.
+    """
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+# Route all of Flask's JSON handling through orjson
+app.json = ORJSONProvider(app)
+
 # ============================
-# 4. Application Configuration
+# 5. Application Configuration
 # ============================
 
 # Configure the SQLite database URI
@@ -46,65 +80,231 @@ app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///sidequests.db'
 # Disable modification tracking to save resources
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+# Reuse a small pool of persistent SQLite connections instead of reopening
+# the database file on every request; a bounded pool also lets concurrent
+# gevent greenlets read in parallel rather than serializing on one handle
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'poolclass': QueuePool,
+    'pool_size': 5,
+    'pool_pre_ping': True,
+    'connect_args': {'check_same_thread': False, 'timeout': 30},
+}
+
 # Secret Key fetched from environment variables for security purposes
 app.secret_key = os.getenv('SECRET_KEY')
 
-# Initialize SQLAlchemy with the Flask app for ORM capabilities
-db = SQLAlchemy(app)
+# Admin credentials are read once at import instead of on every login
+# attempt; the password is kept only as a salted hash so the comparison
+# works against a digest rather than the plaintext value
+ADMIN_USERNAME = os.getenv('ADMIN_USERNAME') or ''
+_admin_password = os.getenv('ADMIN_PASSWORD')
+ADMIN_PASSWORD_HASH = generate_password_hash(_admin_password) if _admin_password else None
+del _admin_password
+
+# Store sessions server-side in Redis when a REDIS_URL is configured; the
+# session cookie then carries only an id instead of a signed payload that
+# must be re-verified and re-signed on every request. Without REDIS_URL the
+# app falls back to Flask's default cookie sessions.
+redis_url = os.getenv('REDIS_URL')
+if redis_url:
+    import redis
+    from flask_session import Session
+    app.config['SESSION_TYPE'] = 'redis'
+    app.config['SESSION_REDIS'] = redis.from_url(redis_url)
+    Session(app)
+
+# Cache compiled Jinja bytecode on disk and pre-compile every template at
+# startup, so no request pays the template parse/compile cost
+_jinja_cache_dir = os.path.join(tempfile.gettempdir(), 'sidequests_jinja_cache')
+os.makedirs(_jinja_cache_dir, exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(_jinja_cache_dir)
+for _template_name in app.jinja_env.list_templates():
+    try:
+        app.jinja_env.get_template(_template_name)
+    except Exception:
+        # Skip templates that fail to compile (e.g. unused legacy files)
+        continue
+
+# Cache rendered pages; share the cache across workers through Redis when
+# available, otherwise through the filesystem. An in-process cache would be
+# wrong here: the default deployment runs multiple gunicorn workers, and a
+# write handled by one worker must invalidate the page for all of them.
+if redis_url:
+    cache = Cache(app, config={'CACHE_TYPE': 'RedisCache', 'CACHE_REDIS_URL': redis_url, 'CACHE_DEFAULT_TIMEOUT': 300})
+else:
+    _render_cache_dir = os.path.join(tempfile.gettempdir(), 'sidequests_render_cache')
+    cache = Cache(app, config={
+        'CACHE_TYPE': 'FileSystemCache',
+        'CACHE_DIR': _render_cache_dir,
+        'CACHE_DEFAULT_TIMEOUT': 300,
+    })
+
+# Bind the shared SQLAlchemy instance from models.py to this app
+db.init_app(app)
 
 # Initialize Flask-Migrate for handling database migrations
 migrate = Migrate(app, db)
 
+# Surface lazy-load regressions during development: with NPLUSONE=1 (and
+# the optional nplusone package installed) every unexpected lazy
+# relationship load raises instead of silently issuing N+1 queries.
+# Not enabled in production.
+if app.debug or os.getenv('NPLUSONE'):
+    try:
+        from nplusone.ext.flask_sqlalchemy import NPlusOne
+        app.config['NPLUSONE_RAISE'] = True
+        NPlusOne(app)
+    except ImportError:
+        # nplusone is a development-only dependency (pip install nplusone)
+        pass
+
 # ============================
-# 5. Database Models
+# 6. Precompiled Statements
 # ============================
 
-class Quest(db.Model):
-    """
-    Represents a Quest in the application.
-
-    Attributes:
-        id (int): Primary key identifier for the quest.
-        name (str): The name of the quest.
-        order (int): The display order of the quest.
-        objectives (List[Objective]): A list of associated objectives.
-    """
-    id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(100), nullable=False)
-    order = db.Column(db.Integer, default=0)
-    # Establish a one-to-many relationship with Objective
-    objectives = db.relationship('Objective', backref='quest', lazy=True)
-
-class Objective(db.Model):
-    """
-    Represents an Objective within a Quest.
-
-    Attributes:
-        id (int): Primary key identifier for the objective.
-        title (str): The title or description of the objective.
-        completed (bool): Status indicating if the objective is completed.
-        order (int): The display order of the objective within its quest.
-        list_id (int): Foreign key linking to the associated Quest.
-    """
-    id = db.Column(db.Integer, primary_key=True)
-    title = db.Column(db.String(200), nullable=False)
-    completed = db.Column(db.Boolean, default=False)
-    order = db.Column(db.Integer, default=0)
-    # Foreign key linking to the Quest model
-    list_id = db.Column(db.Integer, db.ForeignKey('quest.id'), nullable=False)
+# Statements for the hot read paths, constructed once at import so request
+# handlers skip per-call query building (the rendered SQL is further reused
+# through SQLAlchemy's compiled cache)
+_SELECT_QUESTS = select(Quest).options(db.selectinload(Quest.objectives)).order_by(Quest.order)
+_SELECT_QUEST_PAGE = (
+    select(Quest, Objective)
+    .outerjoin(Objective)
+    # The join rows already carry the objectives; without this override the
+    # mapper-level lazy='selectin' would re-fetch them in a second SELECT
+    # as soon as the Quest entity materializes
+    .options(db.lazyload(Quest.objectives))
+    .where(Quest.id == bindparam('list_id'))
+    .order_by(Objective.order)
+)
 
 # ============================
-# 6. Database Initialization
+# 7. Database Initialization
 # ============================
 
-# Ensure all database tables are created
 with app.app_context():
+    # Tune SQLite on every new connection: WAL journaling avoids the full
+    # journal fsync on each commit (the dominant cost of the write routes)
+    # and lets readers proceed during writes; foreign key enforcement is
+    # off by default and is required for ON DELETE CASCADE to fire
+    @event.listens_for(db.engine, 'connect')
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.execute('PRAGMA mmap_size=268435456')
+        cursor.execute('PRAGMA cache_size=-64000')
+        cursor.execute('PRAGMA foreign_keys=ON')
+        cursor.close()
+
+def _upgrade_legacy_schema():
+    """
+    Brings a database created by an older release up to the current schema.
+
+    create_all only adds missing tables, so deployments that persist
+    ./instance keep the original objective table, whose foreign key lacks
+    ON DELETE CASCADE (breaking quest deletion once foreign key enforcement
+    is on), and never get the two ordering indexes. SQLite cannot alter a
+    foreign key in place, so the objective table is rebuilt with the
+    CASCADE clause and its rows copied over; the indexes are created
+    if missing.
+    """
+    # AUTOCOMMIT leaves transaction control to the statements below:
+    # PRAGMA foreign_keys is a no-op inside a transaction
+    with db.engine.connect() as connection:
+        connection = connection.execution_options(isolation_level='AUTOCOMMIT')
+        fk_rows = connection.exec_driver_sql('PRAGMA foreign_key_list(objective)').fetchall()
+        # Row layout: (id, seq, table, from, to, on_update, on_delete, match)
+        if any(row[2] == 'quest' and row[6] != 'CASCADE' for row in fk_rows):
+            connection.exec_driver_sql('PRAGMA foreign_keys=OFF')
+            connection.exec_driver_sql('BEGIN')
+            # Same DDL create_all emits for the current Objective model
+            connection.exec_driver_sql(
+                'CREATE TABLE _objective_upgrade ('
+                'id INTEGER NOT NULL, '
+                'title VARCHAR(200) NOT NULL, '
+                'completed BOOLEAN, '
+                '"order" INTEGER, '
+                'list_id INTEGER NOT NULL, '
+                'PRIMARY KEY (id), '
+                'FOREIGN KEY(list_id) REFERENCES quest (id) ON DELETE CASCADE)'
+            )
+            connection.exec_driver_sql(
+                'INSERT INTO _objective_upgrade '
+                'SELECT id, title, completed, "order", list_id FROM objective'
+            )
+            connection.exec_driver_sql('DROP TABLE objective')
+            connection.exec_driver_sql('ALTER TABLE _objective_upgrade RENAME TO objective')
+            connection.exec_driver_sql('COMMIT')
+            connection.exec_driver_sql('PRAGMA foreign_keys=ON')
+        connection.exec_driver_sql('CREATE INDEX IF NOT EXISTS ix_quest_order ON quest ("order")')
+        connection.exec_driver_sql(
+            'CREATE INDEX IF NOT EXISTS ix_objective_list_order ON objective (list_id, "order")'
+        )
+
+@app.cli.command('init-db')
+def init_db():
+    """
+    Creates all database tables and upgrades pre-existing ones.
+
+    Run once before starting the server (the container entrypoint does this)
+    instead of at import time, so each worker process no longer pays the
+    create_all reflection queries on boot.
+    """
     db.create_all()
+    _upgrade_legacy_schema()
 
 # ============================
-# 7. Helper Functions
+# 8. Helper Functions
 # ============================
 
+# Error payloads shared by the routes, serialized once at import. Each
+# return still builds a fresh Response object because Werkzeug responses
+# are mutable and must not be shared across requests; only the encoding
+# work is hoisted out of the request path.
+_ERROR_RESPONSES = {
+    'quest_name_required': (orjson.dumps({'error': 'Quest name is required.'}), 400),
+    'quest_name_empty': (orjson.dumps({'error': 'Quest name cannot be empty.'}), 400),
+    'quest_not_found': (orjson.dumps({'error': 'Quest not found.'}), 404),
+    'quest_ids_invalid': (orjson.dumps({'error': 'Quest IDs must be integers.'}), 400),
+    'objective_title_required': (orjson.dumps({'error': 'Objective title is required.'}), 400),
+    'objective_title_empty': (orjson.dumps({'error': 'Objective title cannot be empty.'}), 400),
+    'objective_not_found': (orjson.dumps({'error': 'Objective not found or does not belong to this quest.'}), 404),
+    'objective_ids_invalid': (orjson.dumps({'error': 'Objective IDs must be integers.'}), 400),
+}
+
+def _json_error(key):
+    """
+    Returns a JSON error response from the pre-serialized payload table.
+
+    Args:
+        key (str): The key of the error payload in _ERROR_RESPONSES.
+
+    Returns:
+        Response: A JSON response with the payload's status code.
+    """
+    body, status = _ERROR_RESPONSES[key]
+    return app.response_class(body, status=status, mimetype='application/json')
+
+# Cache for the date-based default quest name: (day, formatted name)
+_default_name_cache = (None, None)
+
+def _default_quest_name():
+    """
+    Returns the default quest name for today, e.g. 'Sunday, 8/30/26'.
+
+    The formatted string is cached per calendar day, since the name only
+    depends on the date and add_list may be called in bursts.
+
+    Returns:
+        str: The formatted default quest name.
+    """
+    global _default_name_cache
+    today = date.today()
+    if _default_name_cache[0] != today:
+        _default_name_cache = (today, f"{today:%A}, {today.month}/{today.day}/{today:%y}")
+    return _default_name_cache[1]
+
 def is_safe_url(target):
     """
     Validates whether the target URL is safe for redirects.
@@ -115,10 +315,14 @@ def is_safe_url(target):
     Returns:
         bool: True if the URL is safe, False otherwise.
     """
-    ref_url = urlparse(request.host_url)
+    # Cache the allowed netlocs on g; the host does not change within a
+    # request, so the reference URL only needs to be parsed once
+    allowed_netlocs = getattr(g, '_allowed_netlocs', None)
+    if allowed_netlocs is None:
+        allowed_netlocs = g._allowed_netlocs = frozenset({urlparse(request.host_url).netloc, request.host})
     test_url = urlparse(urljoin(request.host_url, target))
     # Check if the netloc (network location) is the same as the host
-    return test_url.netloc in [ref_url.netloc, request.host]
+    return test_url.netloc in allowed_netlocs
 
 def login_required(f):
     """
@@ -141,7 +345,7 @@ def login_required(f):
     return decorated_function
 
 # ============================
-# 8. Route Definitions
+# 9. Route Definitions
 # ============================
 
 @app.route('/login', methods=['GET', 'POST'])
@@ -161,15 +365,18 @@ def login():
 
     if request.method == 'POST':
         # Retrieve username and password from the submitted form
-        username = request.form.get('username')
-        password = request.form.get('password')
-
-        # Fetch admin credentials from environment variables
-        admin_username = os.getenv('ADMIN_USERNAME')
-        admin_password = os.getenv('ADMIN_PASSWORD')
-
-        # Validate credentials
-        if username == admin_username and password == admin_password:
+        username = request.form.get('username') or ''
+        password = request.form.get('password') or ''
+
+        # Validate credentials in constant time: the username through
+        # hmac.compare_digest and the password against the stored hash.
+        # Compare encoded bytes: compare_digest raises TypeError on
+        # non-ASCII str input
+        if (
+            ADMIN_PASSWORD_HASH is not None
+            and hmac.compare_digest(username.encode(), ADMIN_USERNAME.encode())
+            and check_password_hash(ADMIN_PASSWORD_HASH, password)
+        ):
             # Set the session to indicate the user is logged in
             session['logged_in'] = True
             flash('You were successfully logged in.', 'success')
@@ -183,6 +390,22 @@ def login():
     # Render the login template for GET requests or failed POST attempts
     return render_template('login.html')
 
+@cache.memoize(timeout=300)
+def _render_quest_index():
+    """
+    Renders and caches the main page; quests change rarely, so cache hits
+    skip both the database query and the template render. Every quest
+    mutation route invalidates this entry.
+
+    Returns:
+        str: The rendered 'list_index.html' template with all quests.
+    """
+    # Query all quests ordered by their 'order' attribute, eagerly loading
+    # their objectives in one batched IN query to avoid N+1 lazy loads
+    quests = db.session.execute(_SELECT_QUESTS).scalars().all()
+    # Render the template with the list of quests
+    return render_template('list_index.html', lists=quests)
+
 @app.route('/')
 @login_required
 def root():
@@ -193,12 +416,39 @@ def root():
         User to be authenticated.
 
     Returns:
-        Response: The rendered 'list_index.html' template with all quests.
+        Response: The rendered 'list_index.html' template with all quests,
+        or a 304 Not Modified when the client's cached copy is current.
     """
-    # Query all quests ordered by their 'order' attribute
-    quests = Quest.query.order_by(Quest.order).all()
-    # Render the template with the list of quests
-    return render_template('list_index.html', lists=quests)
+    # Tag the cached HTML with an ETag so revisiting clients get a 304
+    # instead of the full body when nothing has changed
+    response = app.make_response(_render_quest_index())
+    response.add_etag()
+    return response.make_conditional(request)
+
+@cache.memoize(timeout=300)
+def _render_task_list(list_id):
+    """
+    Renders and caches the page for a single quest, keyed by quest ID.
+    Every objective mutation route (and the quest rename/delete routes)
+    invalidates the entry for the affected quest.
+
+    Args:
+        list_id (int): The ID of the quest to render.
+
+    Returns:
+        str: The rendered 'task_list.html' template with quest details and objectives.
+    """
+    # Fetch the quest and its objectives in one joined query instead of a
+    # PK lookup followed by a filtered SELECT
+    rows = db.session.execute(_SELECT_QUEST_PAGE, {'list_id': list_id}).all()
+    # Return a 404 error if the quest does not exist
+    if not rows:
+        abort(404)
+    quest = rows[0][0]
+    # The outer join yields a single (quest, None) row for empty quests
+    objectives = [row[1] for row in rows if row[1] is not None]
+    # Render the template with the quest and its objectives
+    return render_template('task_list.html', tasks=objectives, list=quest)
 
 @app.route('/list/<int:list_id>', methods=['GET'])
 @login_required
@@ -210,14 +460,12 @@ def view_list(list_id):
         list_id (int): The ID of the quest to view.
 
     Returns:
-        Response: The rendered 'task_list.html' template with quest details and objectives.
+        Response: The rendered 'task_list.html' template with quest details
+        and objectives, or a 304 Not Modified for a current cached copy.
     """
-    # Retrieve the quest by ID or return a 404 error if not found
-    quest = Quest.query.get_or_404(list_id)
-    # Retrieve all objectives associated with the quest, ordered by their 'order'
-    objectives = Objective.query.filter_by(list_id=list_id).order_by(Objective.order).all()
-    # Render the template with the quest and its objectives
-    return render_template('task_list.html', tasks=objectives, list=quest)
+    response = app.make_response(_render_task_list(list_id))
+    response.add_etag()
+    return response.make_conditional(request)
 
 @app.route('/add_list', methods=['POST'])
 @login_required
@@ -234,23 +482,29 @@ def add_list():
     """
     # Retrieve the 'name' from the submitted form
     name = request.form.get('name')
-    # If name is not provided or is empty, generate a default name based on the current date
+    # If name is not provided or is empty, use the cached date-based default
     if not name or name.strip() == '':
-        today = datetime.now()
-        name = today.strftime('%A, %m/%d/%y').lstrip('0').replace('/0', '/')
+        name = _default_quest_name()
     if name:
-        # Determine the maximum current order to place the new quest at the end
-        max_order = db.session.query(db.func.max(Quest.order)).scalar() or 0
-        # Create a new Quest instance
-        new_quest = Quest(name=name, order=max_order + 1)
-        # Add and commit the new quest to the database
-        db.session.add(new_quest)
+        # Insert the quest and place it at the end in a single statement, so
+        # the MAX(order) lookup and the INSERT share one round-trip
+        stmt = (
+            insert(Quest)
+            .from_select(
+                ['name', 'order'],
+                select(literal(name), func.coalesce(func.max(Quest.order), 0) + 1)
+            )
+            .returning(Quest.id)
+        )
+        new_id = db.session.execute(stmt).scalar()
         db.session.commit()
+        # Invalidate the cached main page
+        cache.delete_memoized(_render_quest_index)
         # Return the new quest's details as JSON
-        return jsonify({'id': new_quest.id, 'name': new_quest.name})
+        return jsonify({'id': new_id, 'name': name})
     else:
         # Return an error if the quest name is still invalid
-        return jsonify({'error': 'Quest name is required.'}), 400
+        return _json_error('quest_name_required')
 
 @app.route('/delete_list/<int:list_id>', methods=['DELETE'])
 @login_required
@@ -262,22 +516,22 @@ def delete_list(list_id):
         list_id (int): The ID of the quest to delete.
 
     Returns:
-        JSON: Success message upon successful deletion.
+        Response: An empty 204 response upon successful deletion.
         JSON: An error message with status 404 if the quest is not found.
     """
-    # Retrieve the quest by ID or return a 404 error if not found
-    quest = Quest.query.get_or_404(list_id)
-    if quest:
-        # Delete all objectives associated with the quest
-        Objective.query.filter_by(list_id=list_id).delete()
-        # Delete the quest itself
-        db.session.delete(quest)
-        db.session.commit()
-        # Return a success response
-        return jsonify({'success': True})
+    # Issue a single DELETE; the database cascades to the quest's objectives
+    # via ON DELETE CASCADE, so no rows need to be loaded first
+    result = db.session.execute(delete(Quest).where(Quest.id == list_id))
+    db.session.commit()
+    if result.rowcount:
+        # Invalidate the cached main page and the quest's own page
+        cache.delete_memoized(_render_quest_index)
+        cache.delete_memoized(_render_task_list, list_id)
+        # Return 204 No Content; the client only needs the status code
+        return '', 204
     else:
         # Return an error if the quest does not exist
-        return jsonify({'error': 'Quest not found.'}), 404
+        return _json_error('quest_not_found')
 
 
 @app.route('/list/<int:list_id>/add_task', methods=['POST'])
@@ -299,22 +553,39 @@ def add_task(list_id):
     # Retrieve the 'title' from the submitted form
     title = request.form.get('title')
     if title:
-        # Determine the maximum current order to place the new objective at the end
-        max_order = db.session.query(db.func.max(Objective.order)).filter_by(list_id=list_id).scalar() or 0
-        # Create a new Objective instance
-        new_objective = Objective(title=title, list_id=list_id, order=max_order + 1)
-        # Add and commit the new objective to the database
-        db.session.add(new_objective)
-        db.session.commit()
+        # Insert the objective and place it at the end of its quest in a
+        # single statement, so the per-list MAX(order) lookup and the INSERT
+        # share one round-trip
+        stmt = (
+            insert(Objective)
+            .from_select(
+                ['title', 'completed', 'list_id', 'order'],
+                select(
+                    literal(title), literal(False), literal(list_id),
+                    func.coalesce(func.max(Objective.order), 0) + 1
+                ).where(Objective.list_id == list_id)
+            )
+            .returning(Objective.id)
+        )
+        try:
+            new_id = db.session.execute(stmt).scalar()
+            db.session.commit()
+        except IntegrityError:
+            # The foreign key rejected the row: the quest no longer exists
+            # (e.g. a stale tab posting to a quest deleted elsewhere)
+            db.session.rollback()
+            return _json_error('quest_not_found')
+        # Invalidate the cached page for this quest
+        cache.delete_memoized(_render_task_list, list_id)
         # Return the new objective's details as JSON
         return jsonify({
-            'id': new_objective.id,
-            'title': new_objective.title,
-            'completed': new_objective.completed
+            'id': new_id,
+            'title': title,
+            'completed': False
         })
     else:
         # Return an error if the objective title is missing
-        return jsonify({'error': 'Objective title is required.'}), 400
+        return _json_error('objective_title_required')
 
 
 @app.route('/list/<int:list_id>/complete/<int:task_id>', methods=['POST'])
@@ -331,18 +602,24 @@ def complete_task(list_id, task_id):
         JSON: Success message and the new completion status upon success.
         JSON: An error message with status 404 if the objective is not found or does not belong to the quest.
     """
-    # Retrieve the objective by ID or return a 404 error if not found
-    objective = Objective.query.get_or_404(task_id)
-    # Verify that the objective belongs to the specified quest
-    if objective and objective.list_id == list_id:
-        # Toggle the 'completed' status
-        objective.completed = not objective.completed
-        db.session.commit()
+    # Toggle the 'completed' status server-side in a single UPDATE; the
+    # WHERE clause enforces that the objective belongs to the quest, so no
+    # row needs to be loaded first
+    row = db.session.execute(
+        update(Objective)
+        .where(Objective.id == task_id, Objective.list_id == list_id)
+        .values(completed=~Objective.completed)
+        .returning(Objective.completed)
+    ).first()
+    db.session.commit()
+    if row is not None:
+        # Invalidate the cached page for this quest
+        cache.delete_memoized(_render_task_list, list_id)
         # Return the updated status as JSON
-        return jsonify({'success': True, 'completed': objective.completed})
+        return jsonify({'success': True, 'completed': bool(row[0])})
     else:
         # Return an error if the objective does not belong to the quest
-        return jsonify({'error': 'Objective not found or does not belong to this quest.'}), 404
+        return _json_error('objective_not_found')
 
 
 @app.route('/list/<int:list_id>/delete/<int:task_id>', methods=['DELETE'])
@@ -356,21 +633,23 @@ def delete_task(list_id, task_id):
         task_id (int): The ID of the objective to delete.
 
     Returns:
-        JSON: Success message upon successful deletion.
+        Response: An empty 204 response upon successful deletion.
         JSON: An error message with status 404 if the objective is not found or does not belong to the quest.
     """
-    # Retrieve the objective by ID or return a 404 error if not found
-    objective = Objective.query.get_or_404(task_id)
-    # Verify that the objective belongs to the specified quest
-    if objective and objective.list_id == list_id:
-        # Delete the objective from the database
-        db.session.delete(objective)
-        db.session.commit()
-        # Return a success response
-        return jsonify({'success': True})
+    # Delete in a single statement; the WHERE clause enforces that the
+    # objective belongs to the quest
+    result = db.session.execute(
+        delete(Objective).where(Objective.id == task_id, Objective.list_id == list_id)
+    )
+    db.session.commit()
+    if result.rowcount:
+        # Invalidate the cached page for this quest
+        cache.delete_memoized(_render_task_list, list_id)
+        # Return 204 No Content; the client only needs the status code
+        return '', 204
     else:
         # Return an error if the objective does not belong to the quest
-        return jsonify({'error': 'Objective not found or does not belong to this quest.'}), 404
+        return _json_error('objective_not_found')
 
 
 @app.route('/update_list/<int:list_id>', methods=['PUT'])
@@ -386,23 +665,27 @@ def update_list(list_id):
         JSON data with the new 'name' for the quest.
 
     Returns:
-        JSON: Success message upon successful update.
+        Response: An empty 204 response upon successful update.
         JSON: An error message with status 400 if the new name is empty.
     """
     # Parse JSON data from the request
-    data = request.get_json()
-    new_name = data.get('name', '').strip()
+    data = request.get_json(silent=True) or {}
+    new_name = (data.get('name') or '').strip()
     # Validate that the new name is not empty
     if new_name == '':
-        return jsonify({'error': 'Quest name cannot be empty.'}), 400
+        return _json_error('quest_name_empty')
 
     # Retrieve the quest by ID or return a 404 error if not found
-    quest = Quest.query.get_or_404(list_id)
+    quest = db.get_or_404(Quest, list_id)
     # Update the quest's name
     quest.name = new_name
     db.session.commit()
-    # Return a success response
-    return jsonify({'success': True})
+    # Invalidate the cached main page and the quest's own page, which shows
+    # the quest name in its header
+    cache.delete_memoized(_render_quest_index)
+    cache.delete_memoized(_render_task_list, list_id)
+    # Return 204 No Content; the client only needs the status code
+    return '', 204
 
 
 @app.route('/update_task/<int:list_id>/<int:task_id>', methods=['PUT'])
@@ -419,27 +702,33 @@ def update_task(list_id, task_id):
         JSON data with the new 'title' for the objective.
 
     Returns:
-        JSON: Success message upon successful update.
-        JSON: An error message with status 400 if the new title is empty or the objective does not belong to the quest.
+        Response: An empty 204 response upon successful update.
+        JSON: An error message with status 400 if the new title is empty.
+        JSON: An error message with status 404 if the objective is not found or does not belong to the quest.
     """
     # Parse JSON data from the request
-    data = request.get_json()
-    new_title = data.get('title', '').strip()
+    data = request.get_json(silent=True) or {}
+    new_title = (data.get('title') or '').strip()
     # Validate that the new title is not empty
     if new_title == '':
-        return jsonify({'error': 'Objective title cannot be empty.'}), 400
-
-    # Retrieve the objective by ID or return a 404 error if not found
-    objective = Objective.query.get_or_404(task_id)
-    # Verify that the objective belongs to the specified quest
-    if objective.list_id != list_id:
-        return jsonify({'error': 'Objective does not belong to the specified quest.'}), 400
-
-    # Update the objective's title
-    objective.title = new_title
+        return _json_error('objective_title_empty')
+
+    # Update in a single statement; the WHERE clause enforces that the
+    # objective belongs to the quest
+    result = db.session.execute(
+        update(Objective)
+        .where(Objective.id == task_id, Objective.list_id == list_id)
+        .values(title=new_title)
+    )
     db.session.commit()
-    # Return a success response
-    return jsonify({'success': True})
+    if result.rowcount:
+        # Invalidate the cached page for this quest
+        cache.delete_memoized(_render_task_list, list_id)
+        # Return 204 No Content; the client only needs the status code
+        return '', 204
+    else:
+        # Return an error if the objective does not belong to the quest
+        return _json_error('objective_not_found')
 
 
 @app.route('/update_quest_order', methods=['POST'])
@@ -452,23 +741,37 @@ def update_quest_order():
         JSON data with 'ordered_ids', a list of quest IDs in the desired order.
 
     Returns:
-        JSON: Success message upon successful update.
+        Response: An empty 204 response upon successful update.
         JSON: An error message with status 400 if an exception occurs during the update.
     """
     # Parse JSON data from the request
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
     ordered_ids = data.get('ordered_ids', [])
 
+    # Coerce and validate the IDs up front so malformed input is rejected
+    # before a transaction is started
     try:
-        # Iterate over the ordered IDs and update each quest's 'order' attribute
-        for index, quest_id in enumerate(ordered_ids):
-            quest = Quest.query.get(int(quest_id))
-            if quest:
-                quest.order = index
+        ids = [int(quest_id) for quest_id in ordered_ids]
+    except (TypeError, ValueError):
+        return _json_error('quest_ids_invalid')
+
+    try:
+        if ids:
+            # Reorder all quests in one UPDATE ... CASE statement: SQLite
+            # parses and executes a single statement instead of an
+            # executemany round-trip per ID
+            db.session.execute(
+                update(Quest)
+                .where(Quest.id.in_(ids))
+                .values(order=case({quest_id: index for index, quest_id in enumerate(ids)}, value=Quest.id))
+                .execution_options(synchronize_session=False)
+            )
         # Commit all changes to the database
         db.session.commit()
-        # Return a success response
-        return jsonify({'success': True})
+        # Invalidate the cached main page
+        cache.delete_memoized(_render_quest_index)
+        # Return 204 No Content; the client only needs the status code
+        return '', 204
     except Exception as e:
         # Rollback the session in case of an error
         db.session.rollback()
@@ -489,23 +792,37 @@ def update_objective_order(list_id):
         JSON data with 'ordered_ids', a list of objective IDs in the desired order.
 
     Returns:
-        JSON: Success message upon successful update.
+        Response: An empty 204 response upon successful update.
         JSON: An error message with status 400 if an exception occurs during the update.
     """
     # Parse JSON data from the request
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
     ordered_ids = data.get('ordered_ids', [])
 
+    # Coerce and validate the IDs up front so malformed input is rejected
+    # before a transaction is started
+    try:
+        ids = [int(objective_id) for objective_id in ordered_ids]
+    except (TypeError, ValueError):
+        return _json_error('objective_ids_invalid')
+
     try:
-        # Iterate over the ordered IDs and update each objective's 'order' attribute
-        for index, objective_id in enumerate(ordered_ids):
-            objective = Objective.query.get(int(objective_id))
-            if objective and objective.list_id == list_id:
-                objective.order = index
+        if ids:
+            # Reorder all objectives in one UPDATE ... CASE statement; the
+            # list_id guard in the WHERE clause replaces the per-row
+            # ownership check in Python
+            db.session.execute(
+                update(Objective)
+                .where(Objective.id.in_(ids), Objective.list_id == list_id)
+                .values(order=case({objective_id: index for index, objective_id in enumerate(ids)}, value=Objective.id))
+                .execution_options(synchronize_session=False)
+            )
         # Commit all changes to the database
         db.session.commit()
-        # Return a success response
-        return jsonify({'success': True})
+        # Invalidate the cached page for this quest
+        cache.delete_memoized(_render_task_list, list_id)
+        # Return 204 No Content; the client only needs the status code
+        return '', 204
     except Exception as e:
         # Rollback the session in case of an error
         db.session.rollback()
@@ -513,7 +830,7 @@ def update_objective_order(list_id):
         return jsonify({'error': str(e)}), 400
 
 # ============================
-# 9. Application Entry Point
+# 10. Application Entry Point
 # ============================
 
 if __name__ == '__main__':
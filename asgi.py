@@ -0,0 +1,16 @@
+# ============================
+# ASGI Entry Point
+# ============================
+
+# Wrap the WSGI application so it can be served by an ASGI server such as
+# Uvicorn, e.g.:
+#
+#     uvicorn asgi:asgi_app --workers 2
+#
+# This is an alternative to the default Gunicorn/gevent entry point in
+# wsgi.py for deployments that already run an ASGI stack.
+from asgiref.wsgi import WsgiToAsgi
+
+from app import app
+
+asgi_app = WsgiToAsgi(app)
@@ -4,21 +4,48 @@ db = SQLAlchemy()
 
 class Quest(db.Model):
     """
-    Model representing a quest.
+    Represents a Quest in the application.
+
+    Attributes:
+        id (int): Primary key identifier for the quest.
+        name (str): The name of the quest.
+        order (int): The display order of the quest.
+        objectives (List[Objective]): A list of associated objectives.
     """
+    # Index the 'order' column so the main page listing is an index scan
+    __table_args__ = (db.Index('ix_quest_order', 'order'),)
+
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
-    order = db.Column(db.Integer, default=0)  # Order field
-
-    # Relationship to objectives
-    objectives = db.relationship('Objective', backref='quest', lazy=True)
+    order = db.Column(db.Integer, default=0)
+    # Establish a one-to-many relationship with Objective; 'selectin' batches
+    # the child load into a single IN query instead of one SELECT per quest.
+    # Deletions cascade at the database level (see the FK below), so
+    # passive_deletes lets SQLite remove children without loading them.
+    objectives = db.relationship(
+        'Objective', backref='quest', lazy='selectin',
+        cascade='all, delete-orphan', passive_deletes=True
+    )
 
 class Objective(db.Model):
     """
-    Model representing an objective within a quest.
+    Represents an Objective within a Quest.
+
+    Attributes:
+        id (int): Primary key identifier for the objective.
+        title (str): The title or description of the objective.
+        completed (bool): Status indicating if the objective is completed.
+        order (int): The display order of the objective within its quest.
+        list_id (int): Foreign key linking to the associated Quest.
     """
+    # Composite index so fetching a quest's objectives in display order is a
+    # pre-sorted index range scan, and MAX(order) per list is an index probe
+    __table_args__ = (db.Index('ix_objective_list_order', 'list_id', 'order'),)
+
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     completed = db.Column(db.Boolean, default=False)
-    order = db.Column(db.Integer, default=0)  # Order field
-    list_id = db.Column(db.Integer, db.ForeignKey('quest.id'), nullable=False)
+    order = db.Column(db.Integer, default=0)
+    # Foreign key linking to the Quest model; ON DELETE CASCADE lets the
+    # database remove objectives when their quest is deleted
+    list_id = db.Column(db.Integer, db.ForeignKey('quest.id', ondelete='CASCADE'), nullable=False)
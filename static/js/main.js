@@ -146,9 +146,8 @@ function deleteTask(listId, taskId) {
         fetch(`/list/${listId}/delete/${taskId}`, {
             method: 'DELETE'
         })
-            .then(response => response.json())
-            .then(data => {
-                if (data.success) {
+            .then(response => {
+                if (response.status === 204) {
                     const taskCard = document.querySelector(`.task-card[data-task-id='${taskId}']`);
                     if (taskCard) {
                         taskCard.remove();
@@ -161,7 +160,7 @@ function deleteTask(listId, taskId) {
                         sortTasks(null, null);
                     }
                 } else {
-                    alert(data.error);
+                    response.json().then(data => alert(data.error));
                 }
             })
             .catch(error => {
@@ -179,15 +178,14 @@ function deleteList(listId) {
         fetch(`/delete_list/${listId}`, {
             method: 'DELETE'
         })
-            .then(response => response.json())
-            .then(data => {
-                if (data.success) {
+            .then(response => {
+                if (response.status === 204) {
                     const listCard = document.querySelector(`.list-card[data-list-id='${listId}']`);
                     if (listCard) {
                         listCard.remove();
                     }
                 } else {
-                    alert(data.error);
+                    response.json().then(data => alert(data.error));
                 }
             })
             .catch(error => {
@@ -209,9 +207,8 @@ function updateListName(listId, newName) {
         },
         body: JSON.stringify({ name: newName }),
     })
-        .then(response => response.json())
-        .then(data => {
-            if (data.success) {
+        .then(response => {
+            if (response.status === 204) {
                 const listCard = document.querySelector(`.list-card[data-list-id='${listId}']`);
                 if (listCard) {
                     const listNameElement = listCard.querySelector('.list-name');
@@ -220,7 +217,7 @@ function updateListName(listId, newName) {
                     }
                 }
             } else {
-                alert(data.error);
+                response.json().then(data => alert(data.error));
             }
         })
         .catch(error => {
@@ -242,9 +239,8 @@ function updateTaskTitle(listId, taskId, newTitle) {
         },
         body: JSON.stringify({ title: newTitle }),
     })
-        .then(response => response.json())
-        .then(data => {
-            if (data.success) {
+        .then(response => {
+            if (response.status === 204) {
                 const taskCard = document.querySelector(`.task-card[data-task-id='${taskId}']`);
                 if (taskCard) {
                     const taskTitleElement = taskCard.querySelector('.task-title');
@@ -260,7 +256,7 @@ function updateTaskTitle(listId, taskId, newTitle) {
                     sortTasks(null, null);
                 }
             } else {
-                alert(data.error);
+                response.json().then(data => alert(data.error));
             }
         })
         .catch(error => {
@@ -433,9 +429,8 @@ function updateQuestOrder() {
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({ ordered_ids: orderedIds })
     })
-        .then(response => response.json())
-        .then(data => {
-            if (!data.success) {
+        .then(response => {
+            if (response.status !== 204) {
                 alert('Failed to update quest order.');
             } else {
                 // Set sort state to manual
@@ -468,9 +463,8 @@ function updateObjectiveOrder() {
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({ ordered_ids: orderedIds })
     })
-        .then(response => response.json())
-        .then(data => {
-            if (!data.success) {
+        .then(response => {
+            if (response.status !== 204) {
                 alert('Failed to update objective order.');
             } else {
                 // Set sort state to manual
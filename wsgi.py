@@ -0,0 +1,19 @@
+# ============================
+# WSGI Entry Point
+# ============================
+
+# Monkey-patch the standard library before Flask/SQLAlchemy are imported so
+# blocking I/O cooperates with the gevent event loop
+from gevent import monkey
+monkey.patch_all()
+
+# Import the Flask application after patching
+from app import app
+
+if __name__ == '__main__':
+    """
+    Entry point for running the application under Gunicorn:
+
+        gunicorn -k gevent -w 2 --worker-connections 500 --bind 0.0.0.0:8080 wsgi:app
+    """
+    app.run(host='0.0.0.0', port=8080)